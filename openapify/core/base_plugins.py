@@ -1,13 +1,56 @@
 from collections.abc import Sequence
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple, Union
 
+from apispec import APISpec
 from mashumaro.jsonschema import OPEN_API_3_1, JSONSchemaBuilder
 from mashumaro.jsonschema.plugins import BasePlugin as BaseJSONSchemaPlugin
+from typing_extensions import TypeAlias
 
-from openapify.core.models import Body, Cookie, Header, QueryParam
+from openapify.core.models import (
+    Body,
+    Cookie,
+    Header,
+    QueryParam,
+    TypeAnnotation,
+)
 from openapify.core.utils import get_value_type
 from openapify.plugin import BasePlugin
 
+_BuiltSchema: TypeAlias = Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]
+
+# Some different annotations are equal, e.g. Union[int, str] and
+# Union[str, int], but their schemas differ in order, so the repr is a part
+# of the key
+_SchemaKey: TypeAlias = Tuple[TypeAnnotation, str]
+
+# (value_type, repr) -> (json schema, definitions) or None if the type isn't
+# supported by the JSON schema builder. The oldest entries are evicted when
+# the cache is full, so it doesn't keep every type ever built alive.
+_SCHEMA_CACHE: Dict[_SchemaKey, Optional[_BuiltSchema]] = {}
+_SCHEMA_CACHE_MAXSIZE = 1024
+
+
+def _copy_json(value: Any) -> Any:
+    # cheaper than copy.deepcopy for JSON-like data, scalars are shared
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _is_binary_type_cached(value_type: TypeAnnotation) -> bool:
+    return get_value_type(value_type) in (bytes, bytearray)
+
+
+def _is_binary_type(value_type: TypeAnnotation) -> bool:
+    try:
+        return _is_binary_type_cached(value_type)
+    except TypeError:  # unhashable type annotation
+        return get_value_type(value_type) in (bytes, bytearray)
+
 
 class BodyBinaryPlugin(BasePlugin):
     def schema_helper(
@@ -17,7 +60,7 @@ class BodyBinaryPlugin(BasePlugin):
     ) -> Optional[Dict[str, Any]]:
         try:
             if isinstance(obj, Body):
-                if get_value_type(obj.value_type) in (bytes, bytearray):
+                if _is_binary_type(obj.value_type):
                     return {}
 
             return None
@@ -29,10 +72,7 @@ class GuessMediaTypePlugin(BasePlugin):
     def media_type_helper(
         self, body: Body, schema: Dict[str, Any]
     ) -> Optional[str]:
-        if not schema and get_value_type(body.value_type) in (
-            bytes,
-            bytearray,
-        ):
+        if not schema and _is_binary_type(body.value_type):
             return "application/octet-stream"
         else:
             return "application/json"
@@ -40,25 +80,80 @@ class GuessMediaTypePlugin(BasePlugin):
 
 class BaseSchemaPlugin(BasePlugin):
     def __init__(self, plugins: Sequence[BaseJSONSchemaPlugin] = ()):
-        self.json_schema_plugins = plugins
+        self.json_schema_plugins = tuple(plugins)
+        self._builder = JSONSchemaBuilder(
+            dialect=OPEN_API_3_1,
+            ref_prefix="#/components/schemas",
+            plugins=self.json_schema_plugins,
+        )
+        self._published_defs: Set[str] = set()
+        # JSON schema plugins may be stateful and are usually created along
+        # with this plugin, so only schemas built without them are shared
+        # across all plugin instances
+        self._schema_cache: Dict[_SchemaKey, Optional[_BuiltSchema]]
+        if self.json_schema_plugins:
+            self._schema_cache = {}
+        else:
+            self._schema_cache = _SCHEMA_CACHE
+
+    def init_spec(self, spec: APISpec) -> None:
+        super().init_spec(spec)
+        self._published_defs = set()
 
     def schema_helper(
         self,
         obj: Union[Body, Cookie, Header, QueryParam],
         name: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        builder = JSONSchemaBuilder(
-            dialect=OPEN_API_3_1,
-            ref_prefix="#/components/schemas",
-            plugins=self.json_schema_plugins,
-        )
-        try:
-            json_schema = builder.build(obj.value_type)
-        except Exception:
+        built = self._build_json_schema(obj.value_type)
+        if built is None:
             return None
-        schemas = self.spec.components.schemas
-        for name, schema in builder.context.definitions.items():
-            schemas[name] = schema.to_dict()
+        # cached dicts are shared between specs, so we hand out copies
+        json_schema, definitions = built
+        json_schema = _copy_json(json_schema)
+        new_definitions = {
+            name: _copy_json(schema)
+            for name, schema in definitions.items()
+            if name not in self._published_defs
+        }
+        if new_definitions:
+            self.spec.components.schemas.update(new_definitions)
+            self._published_defs.update(new_definitions)
         if isinstance(obj, QueryParam) and obj.default is not None:
-            json_schema.default = obj.default
-        return json_schema.to_dict()
+            json_schema["default"] = obj.default
+        return json_schema
+
+    def _build_json_schema(
+        self, value_type: TypeAnnotation
+    ) -> Optional[_BuiltSchema]:
+        key = (value_type, repr(value_type))
+        try:
+            return self._schema_cache[key]
+        except KeyError:
+            cacheable = True
+        except TypeError:  # unhashable type annotation
+            cacheable = False
+        definitions = self._builder.context.definitions
+        result: Optional[_BuiltSchema]
+        try:
+            json_schema = self._builder.build(value_type)
+            result = (
+                json_schema.to_dict(),
+                {
+                    name: schema.to_dict()
+                    for name, schema in definitions.items()
+                },
+            )
+        except Exception:
+            # unsupported types are only detected by building, so we
+            # remember them to not go through this path again
+            result = None
+        finally:
+            # the builder doesn't skip already known definitions on the next
+            # build, so we drain them to keep cache entries type-scoped
+            definitions.clear()
+        if cacheable:
+            if len(self._schema_cache) >= _SCHEMA_CACHE_MAXSIZE:
+                del self._schema_cache[next(iter(self._schema_cache))]
+            self._schema_cache[key] = result
+        return result
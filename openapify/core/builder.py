@@ -1,13 +1,18 @@
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
     Tuple,
     Type,
+    TypeVar,
     Union,
     overload,
 )
@@ -36,9 +41,20 @@ from openapify.core.models import (
     TypeAnnotation,
 )
 from openapify.core.openapi import models as openapi
+from openapify.decorators import (
+    RequestArgs,
+    __openapify__,
+    __openapify_operation_docs__,
+    __openapify_requests__,
+    __openapify_responses__,
+    __openapify_security_requirements__,
+)
 from openapify.plugin import BasePlugin
 
-BASE_PLUGINS = (BodyBinaryPlugin(), GuessMediaTypePlugin(), BaseSchemaPlugin())
+
+def _make_base_plugins() -> Tuple[BasePlugin, ...]:
+    # base plugins keep per-spec state, so each builder gets its own
+    return BodyBinaryPlugin(), GuessMediaTypePlugin(), BaseSchemaPlugin()
 
 
 METHOD_ORDER = [
@@ -52,8 +68,16 @@ METHOD_ORDER = [
     "options",
     "trace",
 ]
+METHOD_INDEX = {method: index for index, method in enumerate(METHOD_ORDER)}
+
+_ParamT = TypeVar("_ParamT", bound=Union[QueryParam, Header, Cookie])
 
+_LOC_QUERY = openapi.ParameterLocation.QUERY
+_LOC_HEADER = openapi.ParameterLocation.HEADER
+_LOC_COOKIE = openapi.ParameterLocation.COOKIE
 
+
+@lru_cache(maxsize=256)
 def default_response_description(http_code: str) -> str:
     if http_code.lower() == "default":
         return "Default Response"
@@ -64,16 +88,95 @@ def default_response_description(http_code: str) -> str:
         return RESPONSE_DESCRIPTIONS[f"{http_code[0]}XX"]
 
 
+def _plugins_implementing(
+    plugins: Sequence[BasePlugin], method_name: str
+) -> Tuple[BasePlugin, ...]:
+    base_method = getattr(BasePlugin, method_name)
+    return tuple(
+        plugin
+        for plugin in plugins
+        if getattr(type(plugin), method_name) is not base_method
+    )
+
+
+_LEGACY_META_ATTRS = {
+    "request": __openapify_requests__,
+    "response": __openapify_responses__,
+    "operation_docs": __openapify_operation_docs__,
+    "security_requirements": __openapify_security_requirements__,
+}
+
+
+def _bucket_legacy_meta(
+    legacy_meta: Iterable[Tuple[str, Any]],
+) -> Dict[str, List[Any]]:
+    buckets: Dict[str, List[Any]] = {
+        attr: [] for attr in _LEGACY_META_ATTRS.values()
+    }
+    for args_type, args in legacy_meta:
+        attr = _LEGACY_META_ATTRS.get(args_type)
+        if attr is None:
+            continue
+        if args_type == "request":
+            # legacy entries without the flag didn't require the body
+            args = RequestArgs(**{"body_required": None, **args})
+        buckets[attr].append(args)
+    return buckets
+
+
 def _merge_parameters(
     old_parameters: Sequence[openapi.Parameter], new_parameters: Dict[str, str]
 ) -> Sequence[openapi.Parameter]:
-    for parameter in old_parameters or []:
+    if not old_parameters or not new_parameters:
+        return old_parameters
+    for parameter in old_parameters:
         parameter_description = new_parameters.get(parameter.name)
         if parameter_description:
             parameter.description = parameter_description
     return old_parameters
 
 
+def _operation_dict(
+    tags: Optional[List[str]] = None,
+    summary: Optional[str] = None,
+    description: Optional[str] = None,
+    external_docs: Optional[openapi.ExternalDocumentation] = None,
+    operation_id: Optional[str] = None,
+    parameters: Optional[Sequence[openapi.Parameter]] = None,
+    request_body: Optional[openapi.RequestBody] = None,
+    responses: Optional[openapi.Responses] = None,
+    deprecated: Optional[bool] = None,
+    security: Optional[List[Mapping[str, List[str]]]] = None,
+) -> Dict[str, Any]:
+    # the same as openapi.Operation(...).to_dict() but without going through
+    # the whole dataclass for the mostly empty operation fields
+    result: Dict[str, Any] = {}
+    if tags is not None:
+        result["tags"] = list(tags)
+    if summary is not None:
+        result["summary"] = summary
+    if description is not None:
+        result["description"] = description
+    if external_docs is not None:
+        result["externalDocs"] = external_docs.to_dict()
+    if operation_id is not None:
+        result["operationId"] = operation_id
+    if parameters is not None:
+        result["parameters"] = [p.to_dict() for p in parameters]
+    if request_body is not None:
+        result["requestBody"] = request_body.to_dict()
+    if responses is not None:
+        result["responses"] = responses.to_dict()
+    if deprecated is not None:
+        result["deprecated"] = deprecated
+    if security is not None:
+        result["security"] = [
+            {name: list(scopes) for name, scopes in requirement.items()}
+            for requirement in security
+        ]
+    return result
+
+
 class OpenAPISpecBuilder:
     def __init__(
         self,
@@ -98,176 +201,193 @@ class OpenAPISpecBuilder:
                 **options,
             )
         self.spec = spec
-        self.plugins: Sequence[BasePlugin] = (*plugins, *BASE_PLUGINS)
+        self.plugins: Sequence[BasePlugin] = (*plugins, *_make_base_plugins())
         for plugin in self.plugins:
             plugin.init_spec(spec)
+        self._schema_plugins = _plugins_implementing(
+            self.plugins, "schema_helper"
+        )
+        self._media_type_plugins = _plugins_implementing(
+            self.plugins, "media_type_helper"
+        )
+        # id(security) -> (security, built requirements)
+        self._security_cache: Dict[
+            int, Tuple[Any, List[Mapping[str, List[str]]]]
+        ] = {}
 
     def feed_routes(self, routes: Iterable[RouteDef]) -> None:
-        for route in sorted(
+        sorted_routes = sorted(
             routes,
-            key=lambda r: (r.path, METHOD_ORDER.index(r.method.lower())),
-        ):
-            self._process_route(route)
+            key=lambda r: (r.path, METHOD_INDEX[r.method.lower()]),
+        )
+        for path, routes_group in groupby(sorted_routes, attrgetter("path")):
+            self.spec.path(
+                path,
+                operations=dict(
+                    self._build_operation(route) for route in routes_group
+                ),
+                # https://github.com/swagger-api/swagger-ui/issues/5653
+                # summary=summary,
+                # description=description,
+                # parameters=[param.to_dict() for param in route.parameters],
+            )
 
-    def _process_route(self, route: RouteDef) -> None:
+    def _build_operation(self, route: RouteDef) -> Tuple[str, Dict[str, Any]]:
         method = route.method.lower()
-        meta = getattr(route.handler, "__openapify__", [])
+        handler = route.handler
+        requests_meta = getattr(handler, __openapify_requests__, ())
+        responses_meta = getattr(handler, __openapify_responses__, ())
+        operation_docs_meta = getattr(
+            handler, __openapify_operation_docs__, ()
+        )
+        security_meta = getattr(
+            handler, __openapify_security_requirements__, ()
+        )
+        legacy_meta = getattr(handler, __openapify__, None)
+        if legacy_meta:
+            # entries set by hand go before the ones added by decorators
+            legacy = _bucket_legacy_meta(legacy_meta)
+            requests_meta = [*legacy[__openapify_requests__], *requests_meta]
+            responses_meta = [
+                *legacy[__openapify_responses__],
+                *responses_meta,
+            ]
+            operation_docs_meta = [
+                *legacy[__openapify_operation_docs__],
+                *operation_docs_meta,
+            ]
+            security_meta = [
+                *legacy[__openapify_security_requirements__],
+                *security_meta,
+            ]
         responses: Optional[openapi.Responses] = None
         summary = route.summary
         description = route.description
-        tags = route.tags.copy() if route.tags else []
+        # tags and parameters are never mutated in place, so we don't need
+        # to copy the route lists unless something is added to them
+        tags = route.tags or []
         deprecated = None
         operation_id = None
         external_docs = None
         security = None
-        parameters = route.parameters.copy() if route.parameters else []
+        parameters = route.parameters or []
         request_body: Optional[openapi.RequestBody] = None
-        for args_type, args in meta:
-            if args_type == "request":
-                body = args.get("body")
-                if isinstance(body, Body):
-                    body_value_type = body.value_type
-                    media_type = body.media_type
-                    body_required = body.required
-                    body_description = body.description
-                    body_example = body.example
-                    body_examples = body.examples
-                else:
-                    body_value_type = body
-                    media_type = args.get("media_type")
-                    body_required = args.get("body_required")
-                    body_description = args.get("body_description")
-                    body_example = args.get("body_example")
-                    body_examples = args.get("body_examples")
-                if body is not None or media_type is not None:
-                    request_body = self._update_request_body(
-                        request_body=request_body,
-                        value_type=body_value_type,
-                        media_type=media_type,
-                        required=body_required,
-                        description=body_description,
-                        example=body_example,
-                        examples=body_examples,
-                    )
-                query_params = args.get("query_params")
-                if query_params:
-                    parameters.extend(self._build_query_params(query_params))
-                headers = args.get("headers")
-                if headers:
-                    parameters.extend(self._build_request_headers(headers))
-                cookies = args.get("cookies")
-                if cookies:
-                    parameters.extend(self._build_cookies(cookies))
-
-            elif args_type == "response":
-                responses = self._update_responses(responses=responses, **args)
-            elif args_type == "operation_docs":
-                args = args.copy()
-                summary = args.get("summary")
-                description = args.get("description")
-                tags.extend(args.get("tags") or [])
-                # _merge_parameters(parameters, args.get("parameters") or {})
-                operation_id = args.get("operation_id")
-                external_docs = self._build_external_docs(
-                    args.get("external_docs")
-                )
-                deprecated = args.pop("deprecated")
-            elif args_type == "security_requirements":
-                security = self._build_security_requirements(
-                    args.get("requirements")
+        for args in requests_meta:
+            body = args.body
+            if isinstance(body, Body):
+                body_value_type = body.value_type
+                media_type = body.media_type
+                body_required = body.required
+                body_description = body.description
+                body_example = body.example
+                body_examples = body.examples
+            else:
+                body_value_type = body
+                media_type = args.media_type
+                body_required = args.body_required
+                body_description = args.body_description
+                body_example = args.body_example
+                body_examples = args.body_examples
+            if body is not None or media_type is not None:
+                request_body = self._update_request_body(
+                    request_body=request_body,
+                    value_type=body_value_type,
+                    media_type=media_type,
+                    required=body_required,
+                    description=body_description,
+                    example=body_example,
+                    examples=body_examples,
                 )
-        self.spec.path(
-            route.path,
-            operations={
-                method: openapi.Operation(
-                    summary=summary,
-                    description=description,
-                    requestBody=request_body,
-                    responses=responses,
-                    deprecated=deprecated,
-                    tags=tags or None,
-                    parameters=parameters or None,
-                    externalDocs=external_docs,
-                    operationId=operation_id,
-                    security=security,
-                ).to_dict()
-            },
-            # https://github.com/swagger-api/swagger-ui/issues/5653
-            # summary=summary,
-            # description=description,
-            # parameters=[param.to_dict() for param in route.parameters or []],
-        )
-
-    def _build_query_params(
-        self, query_params: Dict[str, Union[Type, QueryParam]]
-    ) -> Sequence[openapi.Parameter]:
-        result = []
-        for name, param in query_params.items():
-            if not isinstance(param, QueryParam):
-                param = QueryParam(param)
-            parameter_schema = self.__build_object_schema_with_plugins(
-                param, name
+            query_params = args.query_params
+            if query_params:
+                parameters = [
+                    *parameters,
+                    *self._build_parameters(
+                        query_params, _LOC_QUERY, QueryParam
+                    ),
+                ]
+            headers = args.headers
+            if headers:
+                parameters = [
+                    *parameters,
+                    *self._build_parameters(headers, _LOC_HEADER, Header),
+                ]
+            cookies = args.cookies
+            if cookies:
+                parameters = [
+                    *parameters,
+                    *self._build_parameters(cookies, _LOC_COOKIE, Cookie),
+                ]
+        for args in responses_meta:
+            responses = self._update_responses(responses=responses, **args)
+        for args in operation_docs_meta:
+            summary = args.get("summary")
+            description = args.get("description")
+            if args.get("tags"):
+                tags = [*tags, *args["tags"]]
+            # _merge_parameters(parameters, args.get("parameters") or {})
+            operation_id = args.get("operation_id")
+            external_docs = self._build_external_docs(
+                args.get("external_docs")
             )
-            if parameter_schema is None:
-                parameter_schema = {}
-            result.append(
-                openapi.Parameter(
-                    name=name,
-                    location=openapi.ParameterLocation.QUERY,
-                    description=param.description,
-                    required=param.required,
-                    deprecated=param.deprecated,
-                    allowEmptyValue=param.allowEmptyValue,
-                    schema=parameter_schema,
-                    style=param.style,
-                    explode=param.explode,
-                    example=param.example,
-                    examples=self._build_examples(param.examples),
-                )
+            deprecated = args.get("deprecated")
+        for args in security_meta:
+            security = self._build_security_requirements(
+                args.get("requirements")
             )
-        return result
+        return method, _operation_dict(
+            summary=summary,
+            description=description,
+            request_body=request_body,
+            responses=responses,
+            deprecated=deprecated,
+            tags=tags or None,
+            parameters=parameters or None,
+            external_docs=external_docs,
+            operation_id=operation_id,
+            security=security,
+        )
 
-    def _build_request_headers(
-        self, headers: Dict[str, Union[str, Header]]
+    def _iter_with_schemas(
+        self, params: Mapping[str, Any], param_cls: Type[_ParamT]
+    ) -> Iterator[Tuple[str, _ParamT, Dict[str, Any]]]:
+        for name, param in params.items():
+            if not isinstance(param, param_cls):
+                param = param_cls(param)
+            schema = self.__build_object_schema_with_plugins(param, name)
+            yield name, param, schema if schema is not None else {}
+
+    def _build_parameters(
+        self,
+        params: Mapping[str, Any],
+        location: openapi.ParameterLocation,
+        param_cls: Union[Type[QueryParam], Type[Header], Type[Cookie]],
     ) -> Sequence[openapi.Parameter]:
-        result = []
-        for name, header in headers.items():
-            if not isinstance(header, Header):
-                header = Header(description=header)
-            parameter_schema = self.__build_object_schema_with_plugins(
-                header, name
+        return [
+            openapi.Parameter(
+                name=name,
+                location=location,
+                description=param.description,
+                required=param.required,
+                deprecated=param.deprecated,
+                allowEmptyValue=param.allowEmptyValue,
+                schema=schema,
+                style=getattr(param, "style", None),
+                explode=getattr(param, "explode", None),
+                example=param.example,
+                examples=self._build_examples(param.examples),
             )
-            if parameter_schema is None:
-                parameter_schema = {}
-            result.append(
-                openapi.Parameter(
-                    name=name,
-                    location=openapi.ParameterLocation.HEADER,
-                    description=header.description,
-                    required=header.required,
-                    deprecated=header.deprecated,
-                    allowEmptyValue=header.allowEmptyValue,
-                    schema=parameter_schema,
-                    example=header.example,
-                    examples=self._build_examples(header.examples),
-                )
+            for name, param, schema in self._iter_with_schemas(
+                params, param_cls
             )
-        return result
+        ]
 
     def _build_response_headers(
         self, headers: Dict[str, Union[str, Header]]
     ) -> Mapping[str, openapi.Header]:
-        result = {}
-        for name, header in headers.items():
-            if not isinstance(header, Header):
-                header = Header(description=header)
-            header_schema = self.__build_object_schema_with_plugins(
-                header, name
-            )
-            if header_schema is None:
-                header_schema = {}
-            result[name] = openapi.Header(
-                schema=header_schema,
+        return {
+            name: openapi.Header(
+                schema=schema,
                 description=header.description,
                 required=header.required,
                 deprecated=header.deprecated,
@@ -275,34 +395,10 @@ class OpenAPISpecBuilder:
                 example=header.example,
                 examples=self._build_examples(header.examples),
             )
-        return result
-
-    def _build_cookies(
-        self, cookies: Dict[str, Union[str, Cookie]]
-    ) -> Sequence[openapi.Parameter]:
-        result = []
-        for name, cookie in cookies.items():
-            if not isinstance(cookie, Cookie):
-                cookie = Cookie(cookie)
-            parameter_schema = self.__build_object_schema_with_plugins(
-                cookie, name
+            for name, header, schema in self._iter_with_schemas(
+                headers, Header
             )
-            if parameter_schema is None:
-                parameter_schema = {}
-            result.append(
-                openapi.Parameter(
-                    name=name,
-                    location=openapi.ParameterLocation.QUERY,
-                    description=cookie.description,
-                    required=cookie.required,
-                    deprecated=cookie.deprecated,
-                    allowEmptyValue=cookie.allowEmptyValue,
-                    schema=parameter_schema,
-                    example=cookie.example,
-                    examples=self._build_examples(cookie.examples),
-                )
-            )
-        return result
+        }
 
     def _update_request_body(
         self,
@@ -421,6 +517,12 @@ class OpenAPISpecBuilder:
     ) -> Optional[List[Mapping[str, List[str]]]]:
         if security is None:
             return None
+        # requirements are usually shared by many handlers, and their
+        # schemes are registered in the spec on the first sighting anyway
+        cached = self._security_cache.get(id(security))
+        if cached is not None:
+            return cached[1]
+        key = security
         result: List[Mapping[str, List[str]]] = []
         if isinstance(security, dict):
             security = [security]
@@ -432,6 +534,7 @@ class OpenAPISpecBuilder:
                     )
                 # TODO: include list of scopes for oauth2 or openIdConnect
                 result.append({name: []})
+        self._security_cache[id(key)] = (key, result)
         return result
 
     @staticmethod
@@ -440,25 +543,30 @@ class OpenAPISpecBuilder:
     ) -> Optional[Mapping[str, openapi.Example]]:
         if examples is None:
             return None
-        result = {}
-        for key, value in examples.items():
-            if not isinstance(value, openapi.Example):
-                result[key] = openapi.Example(value)
-            else:
-                result[key] = value
-        return result
+        if all(isinstance(v, openapi.Example) for v in examples.values()):
+            return examples
+        return {
+            key: (
+                value
+                if isinstance(value, openapi.Example)
+                else openapi.Example(value)
+            )
+            for key, value in examples.items()
+        }
 
     def __build_object_schema_with_plugins(
         self,
         obj: Union[Body, Cookie, Header, QueryParam],
         name: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        return build_object_schema_with_plugins(obj, self.plugins, name)
+        return build_object_schema_with_plugins(
+            obj, self._schema_plugins, name
+        )
 
     def _determine_body_media_type(
         self, body: Body, schema: Dict[str, Any]
     ) -> Optional[str]:
-        for plugin in self.plugins:
+        for plugin in self._media_type_plugins:
             try:
                 media_type = plugin.media_type_helper(body, schema)
                 if media_type is not None:
@@ -1,3 +1,6 @@
+import sys
+from typing import Any, Dict
+
 DEFAULT_SPEC_TITLE = "API"
 DEFAULT_SPEC_VERSION = "1.0.0"
 DEFAULT_OPENAPI_VERSION = "3.1.0"
@@ -70,3 +73,9 @@ RESPONSE_DESCRIPTIONS = {
     "510": "Not Extended",
     "511": "Network Authentication Required",
 }
+
+# slots make instances lighter, but dataclasses support them since 3.10 only
+if sys.version_info >= (3, 10):
+    DATACLASS_SLOTS: Dict[str, Any] = {"slots": True}
+else:
+    DATACLASS_SLOTS: Dict[str, Any] = {}
@@ -8,17 +8,27 @@ from openapify.core.const import (
     DEFAULT_SPEC_VERSION,
 )
 from openapify.core.openapi.models import SecurityScheme, Server
+from openapify.core.utils import json_dumps
 
 
 def merge_dicts(original: Dict, update: Dict) -> Dict:
-    for key, value in update.items():
-        if key not in original:
-            original[key] = value
-        elif isinstance(value, dict):
-            merge_dicts(original[key], value)
+    stack = [(original, update)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if key not in target:
+                target[key] = value
+            elif isinstance(value, dict) and isinstance(target[key], dict):
+                stack.append((target[key], value))
     return original
 
 
+def _server_to_dict(server: Union[str, Server]) -> Dict[str, Any]:
+    if isinstance(server, str):
+        return {"url": server}
+    return server.to_dict()
+
+
 class OpenAPIDocument(APISpec):
     def __init__(
         self,
@@ -31,14 +41,8 @@ class OpenAPIDocument(APISpec):
         **options: Any,
     ) -> None:
         kwargs = {}
-        _servers = []
-        for server in servers or ():
-            if isinstance(server, str):
-                _servers.append({"url": server})
-            else:
-                _servers.append(server.to_dict())
-        if _servers:
-            kwargs["servers"] = _servers
+        if servers:
+            kwargs["servers"] = [_server_to_dict(s) for s in servers]
         super().__init__(
             title=title,
             version=version,
@@ -56,7 +60,8 @@ class OpenAPIDocument(APISpec):
             "openapi": str(self.openapi_version),
             "info": {"title": self.title, "version": self.version},
         }
-        servers = self.options.pop("servers", None)
+        # options are left intact so that the document can be built again
+        servers = self.options.get("servers")
         if servers:
             ret["servers"] = servers
         ret["paths"] = self._paths
@@ -67,3 +72,6 @@ class OpenAPIDocument(APISpec):
             ret["tags"] = self._tags
         ret = merge_dicts(ret, self.options)
         return ret
+
+    def to_json(self) -> bytes:
+        return json_dumps(self.to_dict())
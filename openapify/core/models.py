@@ -3,6 +3,7 @@ from typing import Any, List, Mapping, Optional, Type, Union
 
 from typing_extensions import TypeAlias
 
+from openapify.core.const import DATACLASS_SLOTS
 from openapify.core.openapi.models import (
     Example,
     Parameter,
@@ -16,7 +17,7 @@ SecurityRequirement: TypeAlias = Mapping[str, "SecurityScheme"]
 TypeAnnotation: TypeAlias = Any
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RouteDef:
     path: str
     method: str
@@ -27,7 +28,7 @@ class RouteDef:
     tags: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Body:
     value_type: TypeAnnotation
     media_type: Optional[str] = None
@@ -37,7 +38,7 @@ class Body:
     examples: Optional[Mapping[str, Union[Example, Any]]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Header:
     description: Optional[str] = None
     required: Optional[bool] = None
@@ -48,7 +49,7 @@ class Header:
     examples: Optional[Mapping[str, Union[Example, Any]]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Cookie:
     description: Optional[str] = None
     required: Optional[bool] = None
@@ -59,7 +60,7 @@ class Cookie:
     examples: Optional[Mapping[str, Union[Example, Any]]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QueryParam:
     value_type: TypeAnnotation = str
     default: Optional[Any] = None
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Mapping, Optional, Union
 
@@ -16,6 +16,12 @@ class Object(DataClassDictMixin):
         omit_none = True
 
 
+# shared by the objects that have the "in" field
+class _LocationAliasConfig(Object.Config):
+    serialize_by_alias = True
+    aliases = {"location": "in"}
+
+
 @dataclass
 class ServerVariable(Object):
     default: str
@@ -73,12 +79,15 @@ class Response(Object):
 @dataclass
 class Responses(Object):
     default: Optional[Response] = None
-    codes: Optional[Dict[HttpCode, Response]] = None
+    # codes are added to the top level of the serialized responses
+    codes: Optional[Dict[HttpCode, Response]] = field(
+        default=None, metadata={"serialize": "omit"}
+    )
 
     def __post_serialize__(self, d: Dict[Any, Any]) -> Dict[Any, Any]:
-        codes = d.pop("codes", None)
-        if codes:
-            d.update(codes)
+        if self.codes:
+            for code, response in self.codes.items():
+                d[code] = response.to_dict()
         return d
 
 
@@ -109,9 +118,7 @@ class Parameter(Object):
     examples: Optional[Mapping[str, Example]] = None
     content: Optional[Mapping[str, MediaType]] = None
 
-    class Config(Object.Config):
-        serialize_by_alias = True
-        aliases = {"location": "in"}
+    Config = _LocationAliasConfig
 
 
 @dataclass
@@ -146,9 +153,7 @@ class APIKeySecurityScheme(SecurityScheme):
     type: Literal[SecuritySchemeType.API_KEY] = SecuritySchemeType.API_KEY
     description: Optional[str] = None
 
-    class Config(Object.Config):
-        serialize_by_alias = True
-        aliases = {"location": "in"}
+    Config = _LocationAliasConfig
 
 
 @dataclass
@@ -1,13 +1,50 @@
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
 from mashumaro.core.meta.helpers import get_type_origin
 
 from openapify.core.models import TypeAnnotation
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 def get_value_type(value_type: TypeAnnotation) -> TypeAnnotation:
-    super_type = getattr(value_type, "__supertype__", None)
-    if super_type is not None:
-        return get_value_type(super_type)
-    origin_type = get_type_origin(value_type)
-    if origin_type is not value_type:
-        return get_value_type(origin_type)
-    return value_type
+    while True:
+        super_type = getattr(value_type, "__supertype__", None)
+        if super_type is not None:
+            value_type = super_type
+            continue
+        origin_type = get_type_origin(value_type)
+        if origin_type is not value_type:
+            value_type = origin_type
+            continue
+        return value_type
+
+
+def _json_default(obj: Any) -> Any:
+    # the same as orjson does natively, so that both outputs match
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    elif isinstance(obj, UUID):
+        return str(obj)
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        # the stdlib encoder converts non-string keys as well
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode()
@@ -1,8 +1,10 @@
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -21,12 +23,41 @@ from openapify.core.models import (
 )
 from openapify.core.openapi.models import Example, HttpCode
 
+# legacy list of (kind, args) pairs, see openapify.core.builder
 __openapify__ = "__openapify__"
+__openapify_requests__ = "__openapify_requests__"
+__openapify_responses__ = "__openapify_responses__"
+__openapify_operation_docs__ = "__openapify_operation_docs__"
+__openapify_security_requirements__ = "__openapify_security_requirements__"
 
 
 Handler = TypeVar("Handler")
 
 
+def _append_meta(handler: Any, attr: str, args: Any) -> None:
+    # looking in the handler's own namespace skips the MRO walk and doesn't
+    # pick up the list of a decorated base view
+    meta = handler.__dict__.get(attr)
+    if meta is None:
+        meta = []
+        setattr(handler, attr, meta)
+    meta.append(args)
+
+
+class RequestArgs(NamedTuple):
+    body: Optional[TypeAnnotation] = None
+    media_type: Optional[str] = None
+    body_required: Optional[bool] = False
+    body_description: Optional[str] = None
+    body_example: Optional[Any] = None
+    body_examples: Optional[Mapping[str, Union[Example, Any]]] = None
+    query_params: Optional[Mapping[str, Union[TypeAnnotation, QueryParam]]] = (
+        None
+    )
+    headers: Optional[Mapping[str, Union[str, Header]]] = None
+    cookies: Optional[Mapping[str, Union[str, Cookie]]] = None
+
+
 @overload
 def request_schema(
     body: Optional[Body] = None,
@@ -71,23 +102,19 @@ def request_schema(  # type: ignore[misc]
     cookies: Optional[Mapping[str, Union[str, Cookie]]] = None,
 ) -> Callable[[Handler], Handler]:
     def decorator(handler: Handler) -> Handler:
-        meta = getattr(handler, __openapify__, [])
-        if not meta:
-            handler.__openapify__ = meta  # type: ignore[attr-defined]
-        meta.append(
-            (
-                "request",
-                {
-                    "body": body,
-                    "media_type": media_type,
-                    "body_required": body_required,
-                    "body_description": body_description,
-                    "body_example": body_example,
-                    "body_examples": body_examples,
-                    "query_params": query_params,
-                    "headers": headers,
-                    "cookies": cookies,
-                },
+        _append_meta(
+            handler,
+            __openapify_requests__,
+            RequestArgs(
+                body=body,
+                media_type=media_type,
+                body_required=body_required,
+                body_description=body_description,
+                body_example=body_example,
+                body_examples=body_examples,
+                query_params=query_params,
+                headers=headers,
+                cookies=cookies,
             ),
         )
         return handler
@@ -107,12 +134,10 @@ def response_schema(
     examples: Optional[Mapping[str, Union[Example, Any]]] = None,
 ) -> Callable[[Handler], Handler]:
     def decorator(handler: Handler) -> Handler:
-        meta = getattr(handler, __openapify__, [])
-        if not meta:
-            handler.__openapify__ = meta  # type: ignore[attr-defined]
-        meta.append(
-            (
-                "response",
+        _append_meta(
+            handler,
+            __openapify_responses__,
+            MappingProxyType(
                 {
                     "body": body,
                     "http_code": http_code,
@@ -121,7 +146,7 @@ def response_schema(
                     "headers": headers,
                     "example": example,
                     "examples": examples,
-                },
+                }
             ),
         )
         return handler
@@ -139,12 +164,10 @@ def operation_docs(
     deprecated: Optional[bool] = None,
 ) -> Callable[[Handler], Handler]:
     def decorator(handler: Handler) -> Handler:
-        meta = getattr(handler, __openapify__, [])
-        if not meta:
-            handler.__openapify__ = meta  # type: ignore[attr-defined]
-        meta.append(
-            (
-                "operation_docs",
+        _append_meta(
+            handler,
+            __openapify_operation_docs__,
+            MappingProxyType(
                 {
                     "summary": summary,
                     "description": description,
@@ -153,7 +176,7 @@ def operation_docs(
                     "operation_id": operation_id,
                     "external_docs": external_docs,
                     "deprecated": deprecated,
-                },
+                }
             ),
         )
         return handler
@@ -167,10 +190,11 @@ def security_requirements(
     ] = None,
 ) -> Callable[[Handler], Handler]:
     def decorator(handler: Handler) -> Handler:
-        meta = getattr(handler, __openapify__, [])
-        if not meta:
-            handler.__openapify__ = meta  # type: ignore[attr-defined]
-        meta.append(("security_requirements", {"requirements": requirements}))
+        _append_meta(
+            handler,
+            __openapify_security_requirements__,
+            MappingProxyType({"requirements": requirements}),
+        )
         return handler
 
     return decorator
@@ -1,7 +1,9 @@
 import re
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterable,
     List,
     Mapping,
@@ -39,6 +41,17 @@ from openapify.core.openapi.models import (
 from openapify.plugin import BasePlugin
 
 PARAMETER_TEMPLATE = re.compile(r"{([^:{}]+)(?::(.+))?}")
+# methods that can be described in an OpenAPI path item
+_PATH_ITEM_METHODS = (
+    "get",
+    "put",
+    "post",
+    "delete",
+    "options",
+    "head",
+    "patch",
+    "trace",
+)
 
 
 class AioHttpRouteDef(Protocol):
@@ -61,7 +74,7 @@ def _aiohttp_route_defs_to_route_defs(
 ) -> Iterable[RouteDef]:
     for route in route_defs:
         if route.method == hdrs.METH_ANY:
-            for method in map(str.lower, hdrs.METH_ALL):
+            for method in _PATH_ITEM_METHODS:
                 handler = getattr(route.handler, method, None)
                 if handler:
                     yield RouteDef(route.path, method, handler)
@@ -69,36 +82,54 @@ def _aiohttp_route_defs_to_route_defs(
             yield RouteDef(route.path, route.method, route.handler)
 
 
-def _pull_out_path_parameters(path: str) -> Tuple[str, List[Parameter]]:
-    parameters = []
+@lru_cache(maxsize=256)
+def _schema_for_pattern(regex: Optional[str]) -> Dict[str, Any]:
+    if regex:
+        instance_type = Annotated[str, Pattern(regex)]
+    else:
+        instance_type = str  # type: ignore[misc]
+    return build_json_schema(instance_type, dialect=OPEN_API_3_1).to_dict()
 
-    def _sub(match: re.Match) -> str:
-        name = match.group(1)
-        regex = match.group(2)
-        if regex:
-            instance_type = Annotated[str, Pattern(regex)]
-        else:
-            instance_type = str  # type: ignore[misc]
+
+def _pull_out_path_parameters(path: str) -> Tuple[str, List[Parameter]]:
+    parameters: List[Parameter] = []
+    if "{" not in path:
+        return path, parameters
+    parts = []
+    last_end = 0
+    for match in PARAMETER_TEMPLATE.finditer(path):
+        name, regex = match.groups()
         parameters.append(
             Parameter(
                 name=name,
                 location=ParameterLocation.PATH,
                 required=True,
-                schema=build_json_schema(
-                    instance_type, dialect=OPEN_API_3_1
-                ).to_dict(),
+                # cached schemas are shared, so each parameter gets a copy
+                schema=dict(_schema_for_pattern(regex)),
             )
         )
-        return f"{{{name}}}"
+        parts.append(path[last_end : match.start()])
+        parts.append(f"{{{name}}}")
+        last_end = match.end()
+    parts.append(path[last_end:])
+    return "".join(parts), parameters
 
-    return re.sub(PARAMETER_TEMPLATE, _sub, path), parameters
 
-
-def _complete_routes(routes: Iterable[RouteDef]) -> Iterable[RouteDef]:
+def _complete_routes(
+    routes: Iterable[RouteDef],
+    route_postprocessor: Optional[
+        Callable[[RouteDef], Union[RouteDef, None]]
+    ] = None,
+) -> Iterable[RouteDef]:
     for route in routes:
         route.path, parameters = _pull_out_path_parameters(route.path)
         if parameters:
             route.parameters = parameters
+        if route_postprocessor:
+            processed_route = route_postprocessor(route)
+            if not processed_route:
+                continue
+            route = processed_route
         yield route
 
 
@@ -163,11 +194,8 @@ def build_spec(  # type: ignore[misc]
         routes = _aiohttp_app_to_route_defs(app_or_routes)
     else:
         routes = _aiohttp_route_defs_to_route_defs(app_or_routes)
-    routes = _complete_routes(routes)
-    if route_postprocessor:
-        routes = filter(None, map(route_postprocessor, routes))
     return core_build_spec(
-        routes=routes,
+        routes=_complete_routes(routes, route_postprocessor),
         spec=spec,
         title=title,
         version=version,
@@ -35,6 +35,7 @@ setup(
     ],
     extras_require={
         "aiohttp": ["aiohttp"],
+        "orjson": ["orjson"],
     },
     zip_safe=False,
 )
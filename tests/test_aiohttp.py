@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+
+from openapify import operation_docs  # noqa: E402
+from openapify.ext.web.aiohttp import build_spec  # noqa: E402
+
+
+class View(web.View):
+    @operation_docs(summary="Get")
+    async def get(self) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+    async def connect(self) -> web.Response:
+        return web.Response()  # pragma: no cover
+
+
+def test_any_method_view_skips_methods_outside_path_item() -> None:
+    spec = build_spec([web.view("/", View)]).to_dict()
+    assert spec["paths"] == {"/": {"get": {"summary": "Get"}}}
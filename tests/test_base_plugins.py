@@ -0,0 +1,36 @@
+from typing import Union
+
+from typing_extensions import Literal
+
+from openapify import build_spec, request_schema
+from openapify.core.models import RouteDef
+
+
+@request_schema(query_params={"a": Union[int, str], "b": Literal["x", "y"]})
+def handler_1() -> None:
+    pass  # pragma: no cover
+
+
+@request_schema(query_params={"a": Union[str, int], "b": Literal["y", "x"]})
+def handler_2() -> None:
+    pass  # pragma: no cover
+
+
+def test_equal_annotations_keep_their_own_order() -> None:
+    spec = build_spec(
+        [RouteDef("/1", "get", handler_1), RouteDef("/2", "get", handler_2)]
+    ).to_dict()
+    schemas = [
+        [p["schema"] for p in spec["paths"][path]["get"]["parameters"]]
+        for path in ("/1", "/2")
+    ]
+    assert schemas == [
+        [
+            {"anyOf": [{"type": "integer"}, {"type": "string"}]},
+            {"enum": ["x", "y"]},
+        ],
+        [
+            {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+            {"enum": ["y", "x"]},
+        ],
+    ]
@@ -0,0 +1,69 @@
+from typing import Any, Dict
+
+from openapify import (
+    build_spec,
+    operation_docs,
+    request_schema,
+    response_schema,
+)
+from openapify.core.models import RouteDef
+
+
+def build_operation(handler: Any) -> Dict[str, Any]:
+    spec = build_spec([RouteDef("/", "get", handler)]).to_dict()
+    return spec["paths"]["/"]["get"]
+
+
+def test_legacy_meta_with_unknown_kind() -> None:
+    def handler() -> None:
+        pass  # pragma: no cover
+
+    handler.__openapify__ = [  # type: ignore[attr-defined]
+        ("operation_docs", {"summary": "Legacy"}),
+        ("custom", {}),
+    ]
+    assert build_operation(handler) == {"summary": "Legacy"}
+
+
+def test_legacy_meta_is_merged_with_decorators() -> None:
+    @operation_docs(summary="Decorated")
+    def handler() -> None:
+        pass  # pragma: no cover
+
+    handler.__openapify__ = [  # type: ignore[attr-defined]
+        ("response", {"body": str, "http_code": 200}),
+    ]
+    assert build_operation(handler) == {
+        "summary": "Decorated",
+        "responses": {
+            "200": {
+                "description": "OK",
+                "content": {
+                    "application/json": {"schema": {"type": "string"}}
+                },
+            }
+        },
+    }
+
+
+def test_decorators_dont_set_legacy_meta() -> None:
+    @response_schema(str)
+    def handler() -> None:
+        pass  # pragma: no cover
+
+    assert not hasattr(handler, "__openapify__")
+
+
+def test_cookie_parameters_are_in_cookie() -> None:
+    @request_schema(cookies={"session": "Session ID"})
+    def handler() -> None:
+        pass  # pragma: no cover
+
+    assert build_operation(handler)["parameters"] == [
+        {
+            "name": "session",
+            "in": "cookie",
+            "description": "Session ID",
+            "schema": {"type": "string"},
+        }
+    ]
@@ -0,0 +1,17 @@
+from openapify import operation_docs
+from openapify.decorators import __openapify_operation_docs__
+
+
+def test_decorated_subclass_keeps_base_meta_intact() -> None:
+    @operation_docs(summary="Base")
+    class Base:
+        pass
+
+    @operation_docs(summary="Child")
+    class Child(Base):
+        pass
+
+    base_meta = getattr(Base, __openapify_operation_docs__)
+    child_meta = getattr(Child, __openapify_operation_docs__)
+    assert [args["summary"] for args in base_meta] == ["Base"]
+    assert [args["summary"] for args in child_meta] == ["Child"]
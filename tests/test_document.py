@@ -0,0 +1,15 @@
+from openapify.core.document import OpenAPIDocument
+from openapify.core.openapi.models import Server
+
+
+def test_servers_survive_repeated_serialization() -> None:
+    document = OpenAPIDocument(
+        servers=["https://a.example", Server("https://b.example", "B")]
+    )
+    servers = [
+        {"url": "https://a.example"},
+        {"url": "https://b.example", "description": "B"},
+    ]
+    assert document.to_dict()["servers"] == servers
+    assert document.to_dict()["servers"] == servers
+    assert b'"servers"' in document.to_json()
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from openapify import QueryParam, build_spec, request_schema, response_schema
+from openapify.core import utils
+from openapify.core.models import RouteDef
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Point:
+    x: int
+    created_at: datetime
+    color: Color = Color.GREEN
+
+
+@request_schema(
+    query_params={
+        "color": QueryParam(Color, default=Color.RED),
+        "id": QueryParam(UUID, example=UUID(int=1)),
+    }
+)
+@response_schema(
+    Point,
+    example=Point(1, datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+)
+def handler() -> None:
+    pass  # pragma: no cover
+
+
+def build_json() -> bytes:
+    spec = build_spec(
+        [RouteDef("/points", "get", handler)],
+        **{"x-map": {1: "a", None: "b", 2.5: "c"}},
+    )
+    return spec.to_json()  # type: ignore[attr-defined]
+
+
+def test_json_backends_produce_the_same_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("orjson")
+    with_orjson = build_json()
+    monkeypatch.setattr(utils, "orjson", None)
+    assert build_json() == with_orjson